@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -256,6 +256,11 @@ class HangingOrdersTracker:
         """Creates a list of `HangingOrder`s from the registered `LimitOrder`s."""
         return self._get_equivalent_orders()
 
+    @property
+    def strategy_current_hanging_order_ids(self) -> FrozenSet[str]:
+        """Ids of the current hanging orders, to check many orders against them with set lookups."""
+        return frozenset(o.order_id for o in self.strategy_current_hanging_orders)
+
     def is_order_id_in_hanging_orders(self, order_id: str) -> bool:
         return any((o.order_id == order_id for o in self.strategy_current_hanging_orders))
 
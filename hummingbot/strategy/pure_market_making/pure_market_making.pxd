@@ -55,14 +55,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
     cdef object c_get_mid_price(self)
-    cdef object c_create_base_proposal(self)
+    cdef tuple c_get_price_snapshot(self)
+    cdef object c_create_base_proposal(self, object reference_price)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
-    cdef c_apply_price_band(self, object proposal)
     cdef c_apply_ping_pong(self, object proposal)
     cdef c_apply_order_price_modifiers(self, object proposal)
-    cdef c_apply_order_size_modifiers(self, object proposal)
-    cdef c_apply_inventory_skew(self, object proposal)
+    cdef c_apply_order_size_modifiers(self, object proposal, object price)
+    cdef c_apply_inventory_skew(self, object proposal, object price)
     cdef c_apply_budget_constraint(self, object proposal)
 
     cdef c_filter_out_takers(self, object proposal)
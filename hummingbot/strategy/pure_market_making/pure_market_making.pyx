@@ -9,6 +9,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 import numpy as np
@@ -31,7 +32,7 @@ from hummingbot.strategy.hanging_orders_tracker import (
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from hummingbot.strategy.strategy_base import StrategyBase
-from hummingbot.strategy.utils import order_age
+from hummingbot.strategy.utils import order_age, order_id_timestamp_us
 from .data_types import (
     PriceSize,
     Proposal,
@@ -43,10 +44,25 @@ from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
+s_decimal_one = Decimal(1)
 s_decimal_neg_one = Decimal(-1)
+s_decimal_hundred = Decimal(100)
+s_price_type_map = {
+    "mid_price": PriceType.MidPrice,
+    "best_bid": PriceType.BestBid,
+    "best_ask": PriceType.BestAsk,
+    "last_price": PriceType.LastTrade,
+    "last_own_trade_price": PriceType.LastOwnTrade,
+    "inventory_cost": PriceType.InventoryCost,
+    "custom": PriceType.Custom,
+}
 pmm_logger = None
 
 
+cdef str c_indent_text(str text, str prefix = "    "):
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
 cdef class PureMarketMakingStrategy(StrategyBase):
     OPTION_LOG_CREATE_ORDER = 1 << 3
     OPTION_LOG_MAKER_ORDER_FILLED = 1 << 4
@@ -396,6 +412,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             mid_price = self._market_info.get_mid_price()
         return mid_price
 
+    cdef tuple c_get_price_snapshot(self):
+        """
+        Reads the top of the strategy market order book once
+        :return: (best bid, best ask, mid price) in Decimal
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            str trading_pair = self._market_info.trading_pair
+            object best_bid = market.c_get_price(trading_pair, False)
+            object best_ask = market.c_get_price(trading_pair, True)
+        return best_bid, best_ask, (best_ask + best_bid) / Decimal("2")
+
     @property
     def hanging_order_ids(self) -> List[str]:
         return [o.order_id for o in self._hanging_orders_tracker.strategy_current_hanging_orders]
@@ -420,7 +448,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def active_non_hanging_orders(self) -> List[LimitOrder]:
-        orders = [o for o in self.active_orders if not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)]
+        hanging_order_ids = self._hanging_orders_tracker.strategy_current_hanging_order_ids
+        orders = [o for o in self.active_orders if o.client_order_id not in hanging_order_ids]
         return orders
 
     @property
@@ -451,11 +480,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def inventory_cost_price_delegate(self, value):
         self._inventory_cost_price_delegate = value
 
-    def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
+    def inventory_skew_stats_data_frame(self, price: Optional[Decimal] = None) -> Optional[pd.DataFrame]:
         cdef:
             ExchangeBase market = self._market_info.market
 
-        price = self.get_price()
+        if price is None:
+            price = self.get_price()
         base_asset_amount, quote_asset_amount = self.c_get_adjusted_available_balance(self.active_orders)
         total_order_size = calculate_total_order_size(self._order_amount, self._order_level_amount, self._order_levels)
 
@@ -467,7 +497,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         base_asset_ratio = (base_asset_amount / total_value
                             if total_value > s_decimal_zero
                             else s_decimal_zero)
-        quote_asset_ratio = Decimal("1") - base_asset_ratio if total_value > 0 else 0
+        quote_asset_ratio = s_decimal_one - base_asset_ratio if total_value > 0 else 0
         target_base_ratio = self._inventory_target_base_pct
         inventory_range_multiplier = self._inventory_range_multiplier
         target_base_amount = (total_value * target_base_ratio
@@ -508,9 +538,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         ])
         return inventory_skew_df
 
-    def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+    def pure_mm_assets_df(self, to_show_current_pct: bool, mid_price: Optional[Decimal] = None) -> pd.DataFrame:
         market, trading_pair, base_asset, quote_asset = self._market_info
-        price = self._market_info.get_mid_price()
+        price = self._market_info.get_mid_price() if mid_price is None else mid_price
         base_balance = float(market.get_balance(base_asset))
         quote_balance = float(market.get_balance(quote_asset))
         available_base_balance = float(market.get_available_balance(base_asset))
@@ -530,19 +560,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         df = pd.DataFrame(data=data)
         return df
 
-    def active_orders_df(self) -> pd.DataFrame:
+    def active_orders_df(self, price: Optional[Decimal] = None) -> pd.DataFrame:
         market, trading_pair, base_asset, quote_asset = self._market_info
-        price = self.get_price()
-        active_orders = self.active_orders
+        if price is None:
+            price = self.get_price()
+        active_orders = sorted(self.active_orders, key=lambda x: x.price, reverse=True)
+        hanging_order_ids = self._hanging_orders_tracker.strategy_current_hanging_order_ids
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
-                        not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+                        o.client_order_id not in hanging_order_ids])
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
-        for idx in range(0, len(active_orders)):
-            order = active_orders[idx]
-            is_hanging_order = self._hanging_orders_tracker.is_order_id_in_hanging_orders(order.client_order_id)
+        now = int(time.time())
+        for order in active_orders:
+            is_hanging_order = order.client_order_id in hanging_order_ids
             if not is_hanging_order:
                 if order.is_buy:
                     level = lvl_buy + 1
@@ -552,10 +583,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     lvl_sell += 1
             spread = 0 if price == 0 else abs(order.price - price)/price
             age = "n/a"
-            # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-            if "//" not in order.client_order_id:
-                age = pd.Timestamp(int(time.time()) - int(order.client_order_id[-16:])/1e6,
-                                   unit='s').strftime('%H:%M:%S')
+            # Paper orders have no timestamp so 'n/a'. For real orders, calculate age.
+            timestamp_us = order_id_timestamp_us(order.client_order_id)
+            if timestamp_us != -1:
+                age = pd.Timestamp(now - timestamp_us/1e6, unit='s').strftime('%H:%M:%S')
 
             if is_hanging_order:
                 level_for_calculation = lvl_buy if order.is_buy else lvl_sell
@@ -576,8 +607,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return pd.DataFrame(data=data, columns=columns)
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_data_frame(self,
+                                 market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                 price_snapshot: Optional[Tuple[Decimal, Decimal, Decimal]] = None,
+                                 price: Optional[Decimal] = None) -> pd.DataFrame:
+        """
+        :param price_snapshot: (best bid, best ask, mid price) of the strategy market, fetched if not given
+        :param price: the strategy reference price, fetched if not given
+        """
         markets_data = []
+        if price_snapshot is None:
+            price_snapshot = self.c_get_price_snapshot()
+        if price is None:
+            price = self.get_price()
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
             markets_columns[-1] = "Ref Price (MidPrice)"
@@ -585,16 +627,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if type(self._asset_price_delegate) is OrderBookAssetPriceDelegate:
             market_books.append((self._asset_price_delegate.market, self._asset_price_delegate.trading_pair))
         for market, trading_pair in market_books:
-            bid_price = market.get_price(trading_pair, False)
-            ask_price = market.get_price(trading_pair, True)
+            if market == self._market_info.market and trading_pair == self._market_info.trading_pair:
+                bid_price, ask_price = price_snapshot[0], price_snapshot[1]
+            else:
+                bid_price = market.get_price(trading_pair, False)
+                ask_price = market.get_price(trading_pair, True)
             ref_price = float("nan")
             if market == self._market_info.market and self._inventory_cost_price_delegate is not None:
                 # We're using inventory_cost, show it's price
                 ref_price = self._inventory_cost_price_delegate.get_price()
                 if ref_price is None:
-                    ref_price = self.get_price()
+                    ref_price = price
             elif market == self._market_info.market and self._asset_price_delegate is None:
-                ref_price = self.get_price()
+                ref_price = price
             elif (
                 self._asset_price_delegate is not None
                 and market == self._asset_price_delegate.market
@@ -608,7 +653,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=False)
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -619,24 +664,28 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         warning_lines.extend(self._ping_pong_warning_lines)
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = map_df_to_str(self.market_status_data_frame([self._market_info]))
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        # Read the prices once and share them across the status tables
+        price_snapshot = self.c_get_price_snapshot()
+        price = self.get_price()
+
+        markets_df = map_df_to_str(self.market_status_data_frame([self._market_info], price_snapshot, price))
+        lines.extend(["", "  Markets:", c_indent_text(markets_df.to_string(index=False))])
 
-        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled))
+        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled, price_snapshot[2]))
         # append inventory skew stats.
         if self._inventory_skew_enabled:
-            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame())
+            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame(price))
             assets_df = assets_df.append(inventory_skew_df)
 
         first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        assets_str = assets_df.to_string(index=False, header=False,
+                                         formatters={0: ("{:<" + str(first_col_length) + "}").format})
+        lines.extend(["", "  Assets:", c_indent_text(assets_str)])
 
         # See if there're any open orders.
         if len(self.active_orders) > 0:
-            df = map_df_to_str(self.active_orders_df())
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+            df = map_df_to_str(self.active_orders_df(price))
+            lines.extend(["", "  Orders:", c_indent_text(df.to_string(index=False))])
         else:
             lines.extend(["", "  No active maker orders."])
 
@@ -703,14 +752,16 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
+                # Fetch the reference price once and share it across the proposal steps of this tick
+                price = self.get_price()
                 # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
+                proposal = self.c_create_base_proposal(price)
                 # 2. Apply functions that limit numbers of buys and sells proposal
                 self.c_apply_order_levels_modifiers(proposal)
                 # 3. Apply functions that modify orders price
                 self.c_apply_order_price_modifiers(proposal)
                 # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
+                self.c_apply_order_size_modifiers(proposal, price)
                 # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
                 self.c_apply_budget_constraint(proposal)
 
@@ -727,13 +778,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_base_proposal(self):
+    cdef object c_create_base_proposal(self, object reference_price):
         cdef:
             ExchangeBase market = self._market_info.market
+            str trading_pair = self._market_info.trading_pair
             list buys = []
             list sells = []
+            # Price band: no buys at or above the ceiling, no sells at or below the floor
+            bint create_buys = not (self._price_ceiling > 0 and reference_price >= self._price_ceiling)
+            bint create_sells = not (self._price_floor > 0 and reference_price <= self._price_floor)
 
-        buy_reference_price = sell_reference_price = self.get_price()
+        buy_reference_price = sell_reference_price = reference_price
 
         if self._inventory_cost_price_delegate is not None:
             inventory_cost_price = self._inventory_cost_price_delegate.get_price()
@@ -745,42 +800,49 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 if base_balance > 0:
                     raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
 
+        if not create_buys and not create_sells:
+            return Proposal(buys, sells)
+
         # First to check if a customized order override is configured, otherwise the proposal will be created according
         # to order spread, amount, and levels setting.
         order_override = self._order_override
         if order_override is not None and len(order_override) > 0:
             for key, value in order_override.items():
                 if str(value[0]) in ["buy", "sell"]:
-                    if str(value[0]) == "buy" and not buy_reference_price.is_nan():
-                        price = buy_reference_price * (Decimal("1") - Decimal(str(value[1])) / Decimal("100"))
-                        price = market.c_quantize_order_price(self.trading_pair, price)
+                    if str(value[0]) == "buy" and create_buys and not buy_reference_price.is_nan():
+                        price = buy_reference_price * (s_decimal_one - Decimal(str(value[1])) / s_decimal_hundred)
+                        price = market.c_quantize_order_price(trading_pair, price)
                         size = Decimal(str(value[2]))
-                        size = market.c_quantize_order_amount(self.trading_pair, size)
+                        size = market.c_quantize_order_amount(trading_pair, size)
                         if size > 0 and price > 0:
                             buys.append(PriceSize(price, size))
-                    elif str(value[0]) == "sell" and not sell_reference_price.is_nan():
-                        price = sell_reference_price * (Decimal("1") + Decimal(str(value[1])) / Decimal("100"))
-                        price = market.c_quantize_order_price(self.trading_pair, price)
+                    elif str(value[0]) == "sell" and create_sells and not sell_reference_price.is_nan():
+                        price = sell_reference_price * (s_decimal_one + Decimal(str(value[1])) / s_decimal_hundred)
+                        price = market.c_quantize_order_price(trading_pair, price)
                         size = Decimal(str(value[2]))
-                        size = market.c_quantize_order_amount(self.trading_pair, size)
+                        size = market.c_quantize_order_amount(trading_pair, size)
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
-            if not buy_reference_price.is_nan():
+            # Level sizes do not depend on the side, so quantize them once and reuse them for buys and sells.
+            level_sizes = [market.c_quantize_order_amount(trading_pair,
+                                                          self._order_amount + (self._order_level_amount * level))
+                           for level in range(0, max(self._buy_levels, self._sell_levels))]
+            if create_buys and not buy_reference_price.is_nan():
+                buy_price_ratio = s_decimal_one - self._bid_spread
                 for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                    size = level_sizes[level]
                     if size > 0:
+                        price = buy_reference_price * (buy_price_ratio - (level * self._order_level_spread))
+                        price = market.c_quantize_order_price(trading_pair, price)
                         buys.append(PriceSize(price, size))
-            if not sell_reference_price.is_nan():
+            if create_sells and not sell_reference_price.is_nan():
+                sell_price_ratio = s_decimal_one + self._ask_spread
                 for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                    size = level_sizes[level]
                     if size > 0:
+                        price = sell_reference_price * (sell_price_ratio + (level * self._order_level_spread))
+                        price = market.c_quantize_order_price(trading_pair, price)
                         sells.append(PriceSize(price, size))
 
         return Proposal(buys, sells)
@@ -803,17 +865,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return base_balance, quote_balance
 
-    cdef c_apply_order_levels_modifiers(self, proposal):
-        self.c_apply_price_band(proposal)
+    cdef c_apply_order_levels_modifiers(self, object proposal):
         if self._ping_pong_enabled:
             self.c_apply_ping_pong(proposal)
 
-    cdef c_apply_price_band(self, proposal):
-        if self._price_ceiling > 0 and self.get_price() >= self._price_ceiling:
-            proposal.buys = []
-        if self._price_floor > 0 and self.get_price() <= self._price_floor:
-            proposal.sells = []
-
     cdef c_apply_ping_pong(self, object proposal):
         self._ping_pong_warning_lines = []
         if self._filled_buys_balance == self._filled_sells_balance:
@@ -836,13 +891,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if self._add_transaction_costs_to_orders:
             self.c_apply_add_transaction_costs(proposal)
 
-    cdef c_apply_order_size_modifiers(self, object proposal):
+    cdef c_apply_order_size_modifiers(self, object proposal, object price):
         if self._inventory_skew_enabled:
-            self.c_apply_inventory_skew(proposal)
+            self.c_apply_inventory_skew(proposal, price)
 
-    cdef c_apply_inventory_skew(self, object proposal):
+    cdef c_apply_inventory_skew(self, object proposal, object price):
         cdef:
             ExchangeBase market = self._market_info.market
+            str trading_pair = self._market_info.trading_pair
             object bid_adj_ratio
             object ask_adj_ratio
             object size
@@ -853,7 +909,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bid_ask_ratios = c_calculate_bid_ask_ratios_from_base_asset_ratio(
             float(base_balance),
             float(quote_balance),
-            float(self.get_price()),
+            float(price),
             float(self._inventory_target_base_pct),
             float(total_order_size * self._inventory_range_multiplier)
         )
@@ -862,12 +918,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         for buy in proposal.buys:
             size = buy.size * bid_adj_ratio
-            size = market.c_quantize_order_amount(self.trading_pair, size)
+            size = market.c_quantize_order_amount(trading_pair, size)
             buy.size = size
 
         for sell in proposal.sells:
             size = sell.size * ask_adj_ratio
-            size = market.c_quantize_order_amount(self.trading_pair, size, sell.price)
+            size = market.c_quantize_order_amount(trading_pair, size, sell.price)
             sell.size = size
 
     def adjusted_available_balance_for_orders_budget_constrain(self):
@@ -875,14 +931,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         non_hanging = []
         if self.market_info in self._sb_order_tracker.get_limit_orders():
             all_orders = self._sb_order_tracker.get_limit_orders()[self.market_info].values()
-            non_hanging = [order for order in all_orders
-                           if not self._hanging_orders_tracker.is_order_id_in_hanging_orders(order.client_order_id)]
+            hanging_order_ids = self._hanging_orders_tracker.strategy_current_hanging_order_ids
+            non_hanging = [order for order in all_orders if order.client_order_id not in hanging_order_ids]
         all_non_hanging_orders = list(set(non_hanging) - set(candidate_hanging_orders))
         return self.c_get_adjusted_available_balance(all_non_hanging_orders)
 
     cdef c_apply_budget_constraint(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
+            str trading_pair = self._market_info.trading_pair
+            str base_asset = self._market_info.base_asset
+            str quote_asset = self._market_info.quote_asset
             object quote_size
             object base_size
             object adjusted_amount
@@ -890,14 +949,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
         for buy in proposal.buys:
-            buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
+            buy_fee = market.c_get_fee(base_asset, quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
-            quote_size = buy.size * buy.price * (Decimal(1) + buy_fee.percent)
+            fee_multiplier = s_decimal_one + buy_fee.percent
+            quote_size = buy.size * buy.price * fee_multiplier
 
             # Adjust buy order size to use remaining balance if less than the order amount
             if quote_balance < quote_size:
-                adjusted_amount = quote_balance / (buy.price * (Decimal("1") + buy_fee.percent))
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, adjusted_amount)
+                adjusted_amount = quote_balance / (buy.price * fee_multiplier)
+                adjusted_amount = market.c_quantize_order_amount(trading_pair, adjusted_amount)
                 buy.size = adjusted_amount
                 quote_balance = s_decimal_zero
             elif quote_balance == s_decimal_zero:
@@ -912,7 +972,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             # Adjust sell order size to use remaining balance if less than the order amount
             if base_balance < base_size:
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, base_balance)
+                adjusted_amount = market.c_quantize_order_amount(trading_pair, base_balance)
                 sell.size = adjusted_amount
                 base_balance = s_decimal_zero
             elif base_balance == s_decimal_zero:
@@ -986,16 +1046,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef object c_apply_add_transaction_costs(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
+            str trading_pair = self._market_info.trading_pair
+            str base_asset = self._market_info.base_asset
+            str quote_asset = self._market_info.quote_asset
         for buy in proposal.buys:
-            fee = market.c_get_fee(self.base_asset, self.quote_asset,
+            fee = market.c_get_fee(base_asset, quote_asset,
                                    self._limit_order_type, TradeType.BUY, buy.size, buy.price)
-            price = buy.price * (Decimal(1) - fee.percent)
-            buy.price = market.c_quantize_order_price(self.trading_pair, price)
+            price = buy.price * (s_decimal_one - fee.percent)
+            buy.price = market.c_quantize_order_price(trading_pair, price)
         for sell in proposal.sells:
-            fee = market.c_get_fee(self.base_asset, self.quote_asset,
+            fee = market.c_get_fee(base_asset, quote_asset,
                                    self._limit_order_type, TradeType.SELL, sell.size, sell.price)
-            price = sell.price * (Decimal(1) + fee.percent)
-            sell.price = market.c_quantize_order_price(self.trading_pair, price)
+            price = sell.price * (s_decimal_one + fee.percent)
+            sell.price = market.c_quantize_order_price(trading_pair, price)
 
     cdef c_did_fill_order(self, object order_filled_event):
         cdef:
@@ -1031,11 +1094,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             limit_order_record = self._sb_order_tracker.c_get_limit_order(self._market_info, order_id)
         if limit_order_record is None:
             return
-        active_sell_ids = [x.client_order_id for x in self.active_orders if not x.is_buy]
 
         if self._hanging_orders_enabled:
             # If the filled order is a hanging order, do nothing
-            if order_id in self.hanging_order_ids:
+            if order_id in self._hanging_orders_tracker.strategy_current_hanging_order_ids:
                 self.log_with_clock(
                     logging.INFO,
                     f"({self.trading_pair}) Hanging maker buy order {order_id} "
@@ -1072,10 +1134,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             LimitOrder limit_order_record = self._sb_order_tracker.c_get_limit_order(self._market_info, order_id)
         if limit_order_record is None:
             return
-        active_buy_ids = [x.client_order_id for x in self.active_orders if x.is_buy]
         if self._hanging_orders_enabled:
             # If the filled order is a hanging order, do nothing
-            if order_id in self.hanging_order_ids:
+            if order_id in self._hanging_orders_tracker.strategy_current_hanging_order_ids:
                 self.log_with_clock(
                     logging.INFO,
                     f"({self.trading_pair}) Hanging maker sell order {order_id} "
@@ -1120,11 +1181,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_cancel_active_orders_on_max_age_limit(self):
         """
         Cancels active non hanging orders if they are older than max age limit
+        All of them are cancelled as soon as one is too old, so that the whole set of orders is refreshed together
         """
         cdef:
             list active_orders = self.active_non_hanging_orders
+            object now = int(time.time())
 
-        if active_orders and any(order_age(o) > self._max_order_age for o in active_orders):
+        if active_orders and any(order_age(o, now) > self._max_order_age for o in active_orders):
             for order in active_orders:
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
@@ -1145,8 +1208,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if proposal is not None and \
                 self._order_refresh_tolerance_pct >= 0:
 
-            active_buy_prices = [Decimal(str(o.price)) for o in active_orders if o.is_buy]
-            active_sell_prices = [Decimal(str(o.price)) for o in active_orders if not o.is_buy]
+            active_buy_prices = [o.price for o in active_orders if o.is_buy]
+            active_sell_prices = [o.price for o in active_orders if not o.is_buy]
             proposal_buys = [buy.price for buy in proposal.buys]
             proposal_sells = [sell.price for sell in proposal.sells]
 
@@ -1168,8 +1231,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         cdef:
             list active_orders = self.market_info_to_active_orders.get(self._market_info, [])
             object price = self.get_price()
+            object hanging_order_ids = self._hanging_orders_tracker.strategy_current_hanging_order_ids
         active_orders = [order for order in active_orders
-                         if order.client_order_id not in self.hanging_order_ids]
+                         if order.client_order_id not in hanging_order_ids]
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
@@ -1214,7 +1278,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 )
                 orders_created = True
                 if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
+                    order = self._sb_order_tracker.c_get_limit_order(self._market_info, bid_order_id)
                     if order:
                         self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
                             CreatedPairOfOrders(order, None))
@@ -1237,7 +1301,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 )
                 orders_created = True
                 if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
+                    order = self._sb_order_tracker.c_get_limit_order(self._market_info, ask_order_id)
                     if order:
                         self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
@@ -1255,19 +1319,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             super().notify_hb_app(msg)
 
     def get_price_type(self, price_type_str: str) -> PriceType:
-        if price_type_str == "mid_price":
-            return PriceType.MidPrice
-        elif price_type_str == "best_bid":
-            return PriceType.BestBid
-        elif price_type_str == "best_ask":
-            return PriceType.BestAsk
-        elif price_type_str == "last_price":
-            return PriceType.LastTrade
-        elif price_type_str == 'last_own_trade_price':
-            return PriceType.LastOwnTrade
-        elif price_type_str == 'inventory_cost':
-            return PriceType.InventoryCost
-        elif price_type_str == "custom":
-            return PriceType.Custom
-        else:
+        try:
+            return s_price_type_map[price_type_str]
+        except KeyError:
             raise ValueError(f"Unrecognized price type string {price_type_str}.")
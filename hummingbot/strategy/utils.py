@@ -1,12 +1,28 @@
 import time
+from functools import lru_cache
+from typing import Optional
 
 from hummingbot.core.data_type.limit_order import LimitOrder
 
 
-def order_age(order: LimitOrder) -> float:
+@lru_cache(maxsize=4096)
+def order_id_timestamp_us(client_order_id: str) -> int:
+    """
+    Get the creation timestamp (in microseconds) encoded at the end of a client order id, -1 for paper trade orders
+    """
+    # // indicates a paper trade order id which carries no timestamp
+    if "//" not in client_order_id:
+        return int(client_order_id[-16:])
+    return -1
+
+
+def order_age(order: LimitOrder, current_time: Optional[float] = None) -> float:
     """
     Get the age of a limit order in second, not applicable to paper trade orders
+    :param current_time: the time (in seconds) the age is measured against, defaults to the current time
     """
-    if "//" not in order.client_order_id:
-        return int(time.time()) - int(order.client_order_id[-16:]) / 1e6
+    timestamp_us = order_id_timestamp_us(order.client_order_id)
+    if timestamp_us != -1:
+        now = int(time.time()) if current_time is None else current_time
+        return now - timestamp_us / 1e6
     return -1.
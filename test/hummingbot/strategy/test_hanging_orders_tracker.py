@@ -85,6 +85,20 @@ class TestHangingOrdersTracker(unittest.TestCase):
         self.tracker.remove_all_orders()
         self.assertEqual(len(self.tracker.original_orders), 0)
 
+    def test_strategy_current_hanging_order_ids(self):
+        self.assertEqual(frozenset(), self.tracker.strategy_current_hanging_order_ids)
+
+        buy_order = LimitOrder("Order-number-1", "BTC-USDT", True, "BTC", "USDT", Decimal(99), Decimal(1))
+        sell_order = LimitOrder("Order-number-2", "BTC-USDT", False, "BTC", "USDT", Decimal(101), Decimal(1))
+        self.tracker.add_as_hanging_order(buy_order)
+        self.tracker.add_as_hanging_order(sell_order)
+        self.assertEqual(frozenset({"Order-number-1", "Order-number-2"}),
+                         self.tracker.strategy_current_hanging_order_ids)
+
+        self.tracker._did_complete_hanging_order(next(order for order in self.tracker.strategy_current_hanging_orders
+                                                      if order.order_id == "Order-number-1"))
+        self.assertEqual(frozenset({"Order-number-2"}), self.tracker.strategy_current_hanging_order_ids)
+
     def test_renew_hanging_orders_past_max_order_age(self):
         cancelled_orders_ids = []
         strategy_active_orders = []
@@ -0,0 +1,21 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.utils import order_age, order_id_timestamp_us
+
+
+class StrategyUtilsTest(unittest.TestCase):
+
+    def test_order_id_timestamp_us(self):
+        self.assertEqual(1234567890000000, order_id_timestamp_us("buy-BTC-USDT-1234567890000000"))
+        self.assertEqual(-1, order_id_timestamp_us("paper_trade//buy-BTC-USDT-1"))
+
+    def test_order_age(self):
+        order = LimitOrder("buy-BTC-USDT-1234567890000000", "BTC-USDT", True, "BTC", "USDT", Decimal(100), Decimal(1))
+        paper_order = LimitOrder("paper_trade//buy-BTC-USDT-1", "BTC-USDT", True, "BTC", "USDT", Decimal(100),
+                                 Decimal(1))
+
+        self.assertEqual(10, order_age(order, 1234567900))
+        self.assertEqual(-1, order_age(paper_order, 1234567900))
+        self.assertGreater(order_age(order), 0)